@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 import datetime
 from decimal import Decimal, InvalidOperation
 import logging
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
 from app.exceptions import OperationError
 
@@ -44,9 +44,9 @@ class Calculation:
         """
         Execute calculation using the specified operation.
 
-        Utilizes a dictionary to map operation names to their corresponding
-        lambda functions, enabling dynamic execution of operations based on
-        the operation name.
+        Looks up the operation name in the module-level mapping of operation
+        functions, enabling dynamic execution of operations based on the
+        operation name.
 
         Returns:
             Decimal: The result of the calculation.
@@ -54,22 +54,8 @@ class Calculation:
         Raises:
             OperationError: If the operation is unknown or the calculation fails.
         """
-        # Mapping of operation names to their corresponding functions
-        operations = {
-            "Addition": lambda x, y: x + y,
-            "Subtraction": lambda x, y: x - y,
-            "Multiplication": lambda x, y: x * y,
-            "Division": lambda x, y: x / y if y != 0 else self._raise_div_zero(),
-            "Power": lambda x, y: Decimal(pow(float(x), float(y))) if y >= 0 else self._raise_neg_power(),
-            "Root": lambda x, y: (
-                Decimal(pow(float(x), 1 / float(y))) 
-                if x >= 0 and y != 0 
-                else self._raise_invalid_root(x, y)
-            )
-        }
-
         # Retrieve the operation function based on the operation name
-        op = operations.get(self.operation)
+        op = _OPERATIONS.get(self.operation)
         if not op:
             raise OperationError(f"Unknown operation: {self.operation}")
 
@@ -247,3 +233,18 @@ class Calculation:
             ).normalize())
         except InvalidOperation:  # pragma: no cover
             return str(self.result)
+
+
+# Mapping of operation names to their corresponding functions
+_OPERATIONS: Dict[str, Callable[[Decimal, Decimal], Decimal]] = {
+    "Addition": lambda x, y: x + y,
+    "Subtraction": lambda x, y: x - y,
+    "Multiplication": lambda x, y: x * y,
+    "Division": lambda x, y: x / y if y != 0 else Calculation._raise_div_zero(),
+    "Power": lambda x, y: Decimal(pow(float(x), float(y))) if y >= 0 else Calculation._raise_neg_power(),
+    "Root": lambda x, y: (
+        Decimal(pow(float(x), 1 / float(y)))
+        if x >= 0 and y != 0
+        else Calculation._raise_invalid_root(x, y)
+    )
+}
@@ -2,6 +2,7 @@
 # Calculator Class      #
 ########################
 
+import csv
 from decimal import Decimal
 import logging
 import os
@@ -22,6 +23,9 @@ from app.operations import Operation
 Number = Union[int, float, Decimal]
 CalculationResult = Union[Number, str]
 
+# Column order of the CSV history file
+HISTORY_FIELDS = ['operation', 'operand1', 'operand2', 'result', 'timestamp']
+
 
 class Calculator:
     """
@@ -234,10 +238,11 @@ class Calculator:
 
     def save_history(self) -> None:
         """
-        Save calculation history to a CSV file using pandas.
+        Save calculation history to a CSV file using the csv module.
 
         Serializes the history of calculations and writes them to a CSV file for
-        persistent storage. Utilizes pandas DataFrames for efficient data handling.
+        persistent storage. Rows are streamed through csv.DictWriter, which avoids
+        building an intermediate pandas DataFrame just to write it out.
 
         Raises:
             OperationError: If saving the history fails.
@@ -246,27 +251,17 @@ class Calculator:
             # Ensure the history directory exists
             self.config.history_dir.mkdir(parents=True, exist_ok=True)
 
-            history_data = []
-            for calc in self.history:
-                # Serialize each Calculation instance to a dictionary
-                history_data.append({
-                    'operation': str(calc.operation),
-                    'operand1': str(calc.operand1),
-                    'operand2': str(calc.operand2),
-                    'result': str(calc.result),
-                    'timestamp': calc.timestamp.isoformat()
-                })
-
-            if history_data:
-                # Create a pandas DataFrame from the history data
-                df = pd.DataFrame(history_data)
-                # Write the DataFrame to a CSV file without the index
-                df.to_csv(self.config.history_file, index=False)
+            with open(self.config.history_file, 'w', newline='', encoding='utf-8') as f:
+                # Always write the header so an empty history is still a valid CSV;
+                # end lines with os.linesep as pandas' to_csv did
+                writer = csv.DictWriter(f, fieldnames=HISTORY_FIELDS, lineterminator=os.linesep)
+                writer.writeheader()
+                # Serialize each Calculation instance to a row
+                writer.writerows(calc.to_dict() for calc in self.history)
+
+            if self.history:
                 logging.info(f"History saved successfully to {self.config.history_file}")
             else:
-                # If history is empty, create an empty CSV with headers
-                pd.DataFrame(columns=['operation', 'operand1', 'operand2', 'result', 'timestamp']
-                           ).to_csv(self.config.history_file, index=False)
                 logging.info("Empty history saved")
 
         except Exception as e:  # pragma: no cover
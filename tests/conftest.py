@@ -0,0 +1,13 @@
+import pandas
+import pytest
+
+# Import the heavy modules (pandas C extensions, dotenv loading) once, when pytest
+# loads this conftest before collecting any test module
+import app.calculator
+import app.calculator_memento
+import app.calculator_repl
+
+# Fixture exposing the preloaded pandas module to tests
+@pytest.fixture(scope="session")
+def pd():
+    return pandas
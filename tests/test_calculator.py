@@ -1,109 +1,182 @@
 import datetime
-from pathlib import Path
-import pandas as pd
+import os
 import pytest
-from unittest.mock import Mock, patch, PropertyMock
+from unittest.mock import Mock, mock_open, patch
 from decimal import Decimal
-from tempfile import TemporaryDirectory
-from app.calculator import Calculator
+from app.calculator import HISTORY_FIELDS, Calculator
 from app.calculator_repl import calculator_repl
 from app.calculator_config import CalculatorConfig
 from app.exceptions import OperationError, ValidationError
 from app.history import LoggingObserver, AutoSaveObserver
 from app.operations import OperationFactory
 
-# Fixture to initialize Calculator with a temporary directory for file paths
+# pytest-forked forks every test carrying the forked marker, so only apply it where os.fork exists
+forked_where_supported = pytest.mark.forked if hasattr(os, "fork") else (lambda test: test)
+
+# Config that keeps every path inside base_dir, regardless of environment overrides
+class _TmpConfig(CalculatorConfig):
+    @property
+    def log_dir(self):
+        return self.base_dir / "logs"
+
+    @property
+    def log_file(self):
+        return self.base_dir / "logs/calculator.log"
+
+    @property
+    def history_dir(self):
+        return self.base_dir / "history"
+
+    @property
+    def history_file(self):
+        return self.base_dir / "history/calculator_history.csv"
+
+# Write a header-only history file, the state every test's Calculator should load
+def _seed_history_file(config):
+    config.history_file.write_text(','.join(HISTORY_FIELDS) + "\n")
+
+# Session-wide temporary directory and config shared by every Calculator in this module
+@pytest.fixture(scope="session")
+def calculator_session(tmp_path_factory):
+    # pytest removes the base temp directory once, at the end of the session
+    temp_path = tmp_path_factory.mktemp("calc", numbered=True)
+    config = _TmpConfig(base_dir=temp_path)
+
+    # Create the log and history directories once so each Calculator reuses them
+    config.log_dir.mkdir(parents=True, exist_ok=True)
+    config.history_dir.mkdir(parents=True, exist_ok=True)
+
+    # Start from an empty history file so load_history finds a real file on disk
+    _seed_history_file(config)
+
+    return config, temp_path
+
+# Fixture to initialize Calculator against the shared session directory
 @pytest.fixture
-def calculator():
-    with TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        config = CalculatorConfig(base_dir=temp_path)
-
-        # Patch properties to use the temporary directory paths
-        with patch.object(CalculatorConfig, 'log_dir', new_callable=PropertyMock) as mock_log_dir, \
-             patch.object(CalculatorConfig, 'log_file', new_callable=PropertyMock) as mock_log_file, \
-             patch.object(CalculatorConfig, 'history_dir', new_callable=PropertyMock) as mock_history_dir, \
-             patch.object(CalculatorConfig, 'history_file', new_callable=PropertyMock) as mock_history_file:
-            
-            # Set return values to use paths within the temporary directory
-            mock_log_dir.return_value = temp_path / "logs"
-            mock_log_file.return_value = temp_path / "logs/calculator.log"
-            mock_history_dir.return_value = temp_path / "history"
-            mock_history_file.return_value = temp_path / "history/calculator_history.csv"
-            
-            # Return an instance of Calculator with the mocked config
-            yield Calculator(config=config)
+def calculator(calculator_session):
+    config, _ = calculator_session
+    calc = Calculator(config=config)
+    yield calc
+
+    # Every Calculator loads the shared history file, so put back the header-only seed
+    _seed_history_file(config)
+
+# Operations are stateless strategies, so one instance serves the whole session
+@pytest.fixture(scope="session")
+def add_op():
+    return OperationFactory.create_operation('add')
+
+# Replace builtins.input with a plain iterator over scripted responses
+def _feed_input(monkeypatch, inputs):
+    responses = iter(inputs)
+    monkeypatch.setattr('builtins.input', lambda *args, **kwargs: next(responses))
+
+# Point the default Calculator() paths used by the REPL at base instead of the working directory
+def _isolate_paths(monkeypatch, base):
+    monkeypatch.setenv('CALCULATOR_LOG_DIR', str(base / "logs"))
+    monkeypatch.setenv('CALCULATOR_LOG_FILE', str(base / "logs/calculator.log"))
+    monkeypatch.setenv('CALCULATOR_HISTORY_DIR', str(base / "history"))
+    monkeypatch.setenv('CALCULATOR_HISTORY_FILE', str(base / "history/calculator_history.csv"))
+
+# Fixture keeping each REPL test's log and history files under its own tmp_path
+@pytest.fixture
+def repl_paths(monkeypatch, tmp_path):
+    _isolate_paths(monkeypatch, tmp_path)
+    return tmp_path
 
-# Test Calculator Initialization
+# Fixture returning a setter that scripts the REPL's input() responses
+@pytest.fixture
+def fake_input(monkeypatch):
+    def _set(inputs):
+        _feed_input(monkeypatch, inputs)
+    return _set
+
+# Calculator shared by every test in a class; those tests must undo their own changes
+@pytest.fixture(scope="class")
+def calc(calculator_session):
+    config, _ = calculator_session
+    return Calculator(config=config)
+
+# Put the shared calculator's operation strategy back after the test, even if it fails
+@pytest.fixture
+def restore_strategy(calc):
+    previous = calc.operation_strategy
+    yield
+    calc.operation_strategy = previous
 
-def test_calculator_initialization(calculator):
-    assert calculator.history == []
-    assert calculator.undo_stack == []
-    assert calculator.redo_stack == []
-    assert calculator.operation_strategy is None
+# Tests that leave the calculator as they found it share one instance
 
-# Test Logging Setup
+class TestCalculatorReadOnly:
+    # Test Calculator Initialization
 
-@patch('app.calculator.logging.info')
-def test_logging_setup(logging_info_mock):
-    with patch.object(CalculatorConfig, 'log_dir', new_callable=PropertyMock) as mock_log_dir, \
-         patch.object(CalculatorConfig, 'log_file', new_callable=PropertyMock) as mock_log_file:
-        mock_log_dir.return_value = Path('/tmp/logs')
-        mock_log_file.return_value = Path('/tmp/logs/calculator.log')
-        
-        # Instantiate calculator to trigger logging
-        calculator = Calculator(CalculatorConfig())
-        logging_info_mock.assert_any_call("Calculator initialized with configuration")
+    def test_calculator_initialization(self, calc):
+        assert calc.history == []
+        assert calc.undo_stack == []
+        assert calc.redo_stack == []
+        assert calc.operation_strategy is None
+
+    # Test Adding and Removing Observers
 
-# Test Adding and Removing Observers
+    def test_add_observer(self, calc):
+        observer = LoggingObserver()
+        calc.add_observer(observer)
+        try:
+            assert observer in calc.observers
+        finally:
+            calc.remove_observer(observer)
 
-def test_add_observer(calculator):
-    observer = LoggingObserver()
-    calculator.add_observer(observer)
-    assert observer in calculator.observers
+    def test_remove_observer(self, calc):
+        observer = LoggingObserver()
+        calc.add_observer(observer)
+        calc.remove_observer(observer)
+        assert observer not in calc.observers
 
-def test_remove_observer(calculator):
-    observer = LoggingObserver()
-    calculator.add_observer(observer)
-    calculator.remove_observer(observer)
-    assert observer not in calculator.observers
+    # Test Setting Operations
 
-# Test Setting Operations
+    def test_set_operation(self, calc, add_op, restore_strategy):
+        calc.set_operation(add_op)
+        assert calc.operation_strategy == add_op
 
-def test_set_operation(calculator):
-    operation = OperationFactory.create_operation('add')
-    calculator.set_operation(operation)
-    assert calculator.operation_strategy == operation
+    def test_perform_operation_operation_error(self, calc):
+        with pytest.raises(OperationError, match="No operation set"):
+            calc.perform_operation(2, 3)
+
+    def test_undo_when_nothing_to_undo(self, calc):
+        assert calc.undo() is False
+
+    def test_redo_when_nothing_to_redo(self, calc):
+        assert calc.redo() is False
+
+# Test Logging Setup
+
+@patch('app.calculator.logging.info')
+def test_logging_setup(logging_info_mock, tmp_path):
+    # Instantiate calculator to trigger logging
+    calculator = Calculator(_TmpConfig(base_dir=tmp_path))
+    logging_info_mock.assert_any_call("Calculator initialized with configuration")
 
 # Test Performing Operations
 
-def test_perform_operation_addition(calculator):
-    operation = OperationFactory.create_operation('add')
-    calculator.set_operation(operation)
+def test_perform_operation_addition(calculator, add_op):
+    calculator.set_operation(add_op)
     result = calculator.perform_operation(2, 3)
-    assert result == Decimal('5')
+    assert result == Decimal(5)
 
-def test_perform_operation_validation_error(calculator):
-    calculator.set_operation(OperationFactory.create_operation('add'))
+def test_perform_operation_validation_error(calculator, add_op):
+    calculator.set_operation(add_op)
     with pytest.raises(ValidationError):
         calculator.perform_operation('invalid', 3)
 
-def test_perform_operation_operation_error(calculator):
-    with pytest.raises(OperationError, match="No operation set"):
-        calculator.perform_operation(2, 3)
-
 # Test Undo/Redo Functionality
 
-def test_undo(calculator):
-    operation = OperationFactory.create_operation('add')
-    calculator.set_operation(operation)
+def test_undo(calculator, add_op):
+    calculator.set_operation(add_op)
     calculator.perform_operation(2, 3)
     calculator.undo()
     assert calculator.history == []
 
-def test_redo(calculator):
-    operation = OperationFactory.create_operation('add')
-    calculator.set_operation(operation)
+def test_redo(calculator, add_op):
+    calculator.set_operation(add_op)
     calculator.perform_operation(2, 3)
     calculator.undo()
     calculator.redo()
@@ -111,17 +184,22 @@ def test_redo(calculator):
 
 # Test History Management
 
-@patch('app.calculator.pd.DataFrame.to_csv')
-def test_save_history(mock_to_csv, calculator):
-    operation = OperationFactory.create_operation('add')
-    calculator.set_operation(operation)
+@patch('app.calculator.csv.DictWriter')
+@patch('builtins.open', new_callable=mock_open)
+def test_save_history(mock_file, mock_writer, calculator, add_op):
+    calculator.set_operation(add_op)
     calculator.perform_operation(2, 3)
     calculator.save_history()
-    mock_to_csv.assert_called_once()
+    # Only the hand-off to the csv writer is under test, so nothing touches disk
+    mock_file.assert_called_once_with(
+        calculator.config.history_file, 'w', newline='', encoding='utf-8'
+    )
+    mock_writer.return_value.writeheader.assert_called_once()
+    rows = list(mock_writer.return_value.writerows.call_args.args[0])
+    assert rows == [calc.to_dict() for calc in calculator.history]
 
 @patch('app.calculator.pd.read_csv')
-@patch('app.calculator.Path.exists', return_value=True)
-def test_load_history(mock_exists, mock_read_csv, calculator):
+def test_load_history(mock_read_csv, calculator, pd):
     # Mock CSV data to match the expected format in from_dict
     mock_read_csv.return_value = pd.DataFrame({
         'operation': ['Addition'],
@@ -138,18 +216,17 @@ def test_load_history(mock_exists, mock_read_csv, calculator):
         assert len(calculator.history) == 1
         # Verify the loaded values
         assert calculator.history[0].operation == "Addition"
-        assert calculator.history[0].operand1 == Decimal("2")
-        assert calculator.history[0].operand2 == Decimal("3")
-        assert calculator.history[0].result == Decimal("5")
+        assert calculator.history[0].operand1 == Decimal(2)
+        assert calculator.history[0].operand2 == Decimal(3)
+        assert calculator.history[0].result == Decimal(5)
     except OperationError:
         pytest.fail("Loading history failed due to OperationError")
         
             
 # Test Clearing History
 
-def test_clear_history(calculator):
-    operation = OperationFactory.create_operation('add')
-    calculator.set_operation(operation)
+def test_clear_history(calculator, add_op):
+    calculator.set_operation(add_op)
     calculator.perform_operation(2, 3)
     calculator.clear_history()
     assert calculator.history == []
@@ -158,192 +235,154 @@ def test_clear_history(calculator):
 
 # Test REPL Commands (using patches for input/output handling)
 
-@patch('builtins.input', side_effect=['exit'])
-@patch('builtins.print')
-def test_calculator_repl_exit(mock_print, mock_input):
+@forked_where_supported
+def test_calculator_repl_exit(repl_paths, fake_input, capsys):
+    fake_input(['exit'])
     with patch('app.calculator.Calculator.save_history') as mock_save_history:
         calculator_repl()
         mock_save_history.assert_called_once()
-        mock_print.assert_any_call("History saved successfully.")
-        mock_print.assert_any_call("Goodbye!")
-
-@patch('builtins.input', side_effect=['help', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_help(mock_print, mock_input):
-    calculator_repl()
-    mock_print.assert_any_call("\nAvailable commands:")
-
-@patch('builtins.input', side_effect=['add', '2', '3', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_addition(mock_print, mock_input):
-    calculator_repl()
-    mock_print.assert_any_call("\nResult: 5")
+    output = capsys.readouterr().out.splitlines()
+    assert "History saved successfully." in output
+    assert "Goodbye!" in output
 
 # Additional coverage for Calculator branches
 
-def test_history_trim_when_exceeds_max():
-    from tempfile import TemporaryDirectory
-    from pathlib import Path
-    from decimal import Decimal
-    from unittest.mock import patch, PropertyMock
-
-    with TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        config = CalculatorConfig(base_dir=temp_path, max_history_size=1)
-
-        with patch.object(CalculatorConfig, 'log_dir', new_callable=PropertyMock) as mock_log_dir, \
-             patch.object(CalculatorConfig, 'log_file', new_callable=PropertyMock) as mock_log_file, \
-             patch.object(CalculatorConfig, 'history_dir', new_callable=PropertyMock) as mock_history_dir, \
-             patch.object(CalculatorConfig, 'history_file', new_callable=PropertyMock) as mock_history_file:
-
-            mock_log_dir.return_value = temp_path / "logs"
-            mock_log_file.return_value = temp_path / "logs/calculator.log"
-            mock_history_dir.return_value = temp_path / "history"
-            mock_history_file.return_value = temp_path / "history/calculator_history.csv"
+def test_history_trim_when_exceeds_max(tmp_path_factory, add_op):
+    temp_path = tmp_path_factory.mktemp("trim", numbered=True)
+    config = _TmpConfig(base_dir=temp_path, max_history_size=1)
 
-            calc = Calculator(config=config)
-            calc.set_operation(OperationFactory.create_operation('add'))
-            calc.perform_operation(1, 1)
-            # Second operation should trigger trimming of history (pop from front)
-            calc.perform_operation(2, 2)
-            assert len(calc.history) == 1
+    calc = Calculator(config=config)
+    calc.set_operation(add_op)
+    calc.perform_operation(1, 1)
+    # Second operation should trigger trimming of history (pop from front)
+    calc.perform_operation(2, 2)
+    assert len(calc.history) == 1
 
 
 def test_save_history_when_empty(calculator):
     # Ensure empty history path executes
     calculator.clear_history()
-    calculator.save_history()  # Should not raise
+    calculator.save_history()
+    history_file = calculator.config.history_file
+    assert history_file.read_bytes() == (','.join(HISTORY_FIELDS) + os.linesep).encode('utf-8')
+
+
+def test_save_and_load_history_round_trip(tmp_path, add_op):
+    config = _TmpConfig(base_dir=tmp_path)
+    calc = Calculator(config=config)
+    calc.set_operation(add_op)
+    calc.perform_operation(2, 3)
+    calc.perform_operation('1.5', '2.25')
+    calc.save_history()
+
+    # The real file holds the header row, then one row per calculation, each ending in os.linesep
+    rows = [HISTORY_FIELDS] + [list(c.to_dict().values()) for c in calc.history]
+    expected = ''.join(','.join(row) + os.linesep for row in rows)
+    assert config.history_file.read_bytes() == expected.encode('utf-8')
+
+    restored = Calculator(config=config)
+    assert restored.history == calc.history
+    assert [c.timestamp for c in restored.history] == [c.timestamp for c in calc.history]
 
 
 @patch('app.calculator.pd.read_csv')
-@patch('app.calculator.Path.exists', return_value=True)
-def test_load_history_when_empty_dataframe(mock_exists, mock_read_csv, calculator):
-    import pandas as pd
+def test_load_history_when_empty_dataframe(mock_read_csv, calculator, pd):
     mock_read_csv.return_value = pd.DataFrame()
     calculator.load_history()  # Should take the empty DataFrame branch
     assert calculator.history == []
 
 
-def test_get_history_dataframe(calculator):
-    calc_op = OperationFactory.create_operation('add')
-    calculator.set_operation(calc_op)
+def test_get_history_dataframe(calculator, add_op):
+    calculator.set_operation(add_op)
     calculator.perform_operation(2, 3)
     df = calculator.get_history_dataframe()
     assert 'operation' in df.columns and len(df) == 1
 
 
-def test_show_history(calculator):
-    op = OperationFactory.create_operation('add')
-    calculator.set_operation(op)
+def test_show_history(calculator, add_op):
+    calculator.set_operation(add_op)
     calculator.perform_operation(2, 3)
     history_list = calculator.show_history()
     assert any("Addition(" in entry for entry in history_list)
 
 
-def test_undo_when_nothing_to_undo(calculator):
-    assert calculator.undo() is False
-
-
-def test_redo_when_nothing_to_redo(calculator):
-    assert calculator.redo() is False
-
-
 # Additional REPL command coverage
 
-@patch('builtins.input', side_effect=['history', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_history_empty(mock_print, mock_input):
-    # Mock show_history to ensure empty output regardless of any persisted data
-    with patch.object(Calculator, 'show_history', return_value=[]):
-        calculator_repl()
-        mock_print.assert_any_call("No calculations in history")
-
-
-@patch('builtins.input', side_effect=['history', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_history_non_empty(mock_print, mock_input):
-    with patch.object(Calculator, 'show_history', return_value=['a', 'b']):
-        calculator_repl()
-        mock_print.assert_any_call("\nCalculation History:")
-        mock_print.assert_any_call("1. a")
-        mock_print.assert_any_call("2. b")
-
-
-@patch('builtins.input', side_effect=['clear', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_clear(mock_print, mock_input):
-    calculator_repl()
-    mock_print.assert_any_call("History cleared")
-
-
-@patch('builtins.input', side_effect=['undo', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_undo_true(mock_print, mock_input):
-    with patch.object(Calculator, 'undo', return_value=True):
+# Commands replayed through a single REPL session, with the output each one must produce
+_REPL_SCRIPT = [
+    ('help', ['help'], ["\nAvailable commands:"]),
+    ('addition', ['add', '2', '3'], ["\nResult: 5"]),
+    ('history_empty', ['history'], ["No calculations in history"]),
+    ('history_non_empty', ['history'], ["\nCalculation History:", "1. a", "2. b"]),
+    ('clear', ['clear'], ["History cleared"]),
+    ('undo_true', ['undo'], ["Operation undone"]),
+    ('undo_false', ['undo'], ["Nothing to undo"]),
+    ('redo_true', ['redo'], ["Operation redone"]),
+    ('redo_false', ['redo'], ["Nothing to redo"]),
+    ('cancel_first_number', ['add', 'cancel'], ["Operation cancelled"]),
+    ('cancel_second_number', ['add', '2', 'cancel'], ["Operation cancelled"]),
+    ('unknown_command', ['foobar'], ["Unknown command: 'foobar'. Type 'help' for available commands."]),
+]
+
+# Collect the first argument of every recorded print call into a set
+def printed(calls):
+    return {c.args[0] for c in calls if c.args}
+
+# Run the whole script through one calculator_repl() call and keep what each step printed
+@pytest.fixture(scope="module")
+def repl_script_output(tmp_path_factory):
+    responses = iter(
+        [(name, line) for name, commands, _ in _REPL_SCRIPT for line in commands] + [('exit', 'exit')]
+    )
+    # Index into the recorded print calls at which each step's first input was read
+    step_starts = {}
+
+    # Calculator methods answer in the order the script calls them
+    with pytest.MonkeyPatch.context() as monkeypatch, \
+         patch('builtins.print') as mock_print, \
+         patch.object(Calculator, 'show_history', side_effect=[[], ['a', 'b']]), \
+         patch.object(Calculator, 'undo', side_effect=[True, False]), \
+         patch.object(Calculator, 'redo', side_effect=[True, False]):
+        def scripted_input(*args, **kwargs):
+            name, line = next(responses)
+            step_starts.setdefault(name, len(mock_print.call_args_list))
+            return line
+
+        _isolate_paths(monkeypatch, tmp_path_factory.mktemp("repl", numbered=True))
+        monkeypatch.setattr('builtins.input', scripted_input)
         calculator_repl()
-        mock_print.assert_any_call("Operation undone")
 
-
-@patch('builtins.input', side_effect=['undo', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_undo_false(mock_print, mock_input):
-    with patch.object(Calculator, 'undo', return_value=False):
-        calculator_repl()
-        mock_print.assert_any_call("Nothing to undo")
-
-
-@patch('builtins.input', side_effect=['redo', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_redo_true(mock_print, mock_input):
-    with patch.object(Calculator, 'redo', return_value=True):
-        calculator_repl()
-        mock_print.assert_any_call("Operation redone")
-
-
-@patch('builtins.input', side_effect=['redo', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_redo_false(mock_print, mock_input):
-    with patch.object(Calculator, 'redo', return_value=False):
-        calculator_repl()
-        mock_print.assert_any_call("Nothing to redo")
-
-
-@patch('builtins.input', side_effect=['save', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_save(mock_print, mock_input):
+    # Each step owns the output printed between its first input and the next step's
+    calls = mock_print.call_args_list
+    names = [name for name, _, _ in _REPL_SCRIPT] + ['exit']
+    return {
+        name: printed(calls[step_starts[name]:step_starts[next_name]])
+        for name, next_name in zip(names, names[1:])
+    }
+
+@pytest.mark.parametrize("name, expected", [
+    (name, expected) for name, _, expected in _REPL_SCRIPT
+], ids=[name for name, _, _ in _REPL_SCRIPT])
+def test_calculator_repl_commands(repl_script_output, name, expected):
+    for line in expected:
+        assert line in repl_script_output[name]
+
+
+@forked_where_supported
+def test_calculator_repl_save(repl_paths, fake_input, capsys):
+    fake_input(['save', 'exit'])
     with patch.object(Calculator, 'save_history') as mock_save:
         calculator_repl()
         # Called once for 'save' and again on 'exit'
         assert mock_save.call_count == 2
-        mock_print.assert_any_call("History saved successfully")
+    assert "History saved successfully" in capsys.readouterr().out.splitlines()
 
 
-@patch('builtins.input', side_effect=['load', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_load(mock_print, mock_input):
+@forked_where_supported
+def test_calculator_repl_load(repl_paths, fake_input, capsys):
+    fake_input(['load', 'exit'])
     with patch.object(Calculator, 'load_history') as mock_load:
         calculator_repl()
         # Called once on initialization and once for 'load'
         assert mock_load.call_count == 2
-        mock_print.assert_any_call("History loaded successfully")
-
-
-@patch('builtins.input', side_effect=['add', 'cancel', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_cancel_first_number(mock_print, mock_input):
-    calculator_repl()
-    mock_print.assert_any_call("Operation cancelled")
-
-
-@patch('builtins.input', side_effect=['add', '2', 'cancel', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_cancel_second_number(mock_print, mock_input):
-    calculator_repl()
-    mock_print.assert_any_call("Operation cancelled")
-
-
-@patch('builtins.input', side_effect=['foobar', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_unknown_command(mock_print, mock_input):
-    calculator_repl()
-    mock_print.assert_any_call("Unknown command: 'foobar'. Type 'help' for available commands.")
+    assert "History loaded successfully" in capsys.readouterr().out.splitlines()
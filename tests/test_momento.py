@@ -4,6 +4,33 @@ from datetime import datetime, timedelta
 from app.calculator_memento import CalculatorMemento
 from app.calculation import Calculation
 
+# Canonical ISO timestamp reused by the from_dict tests
+_ISO_NOW = datetime(2024, 1, 15, 10, 30, 45, 123456).isoformat()
+
+# Pre-built calculations shared by the large-history tests
+_LARGE_HISTORY = tuple(
+    Calculation(operation="Addition", operand1=Decimal(i), operand2=Decimal(1))
+    for i in range(100)
+)
+
+
+@pytest.fixture(scope="module")
+def sample_dict():
+    """Serialized two-entry memento shared by the to_dict tests."""
+    history = [
+        Calculation(operation="Addition", operand1=Decimal(2), operand2=Decimal(3)),
+        Calculation(operation="Multiplication", operand1=Decimal(4), operand2=Decimal(5)),
+    ]
+    return CalculatorMemento(
+        history=history, timestamp=datetime(2024, 1, 15, 10, 30, 45, 123456)
+    ).to_dict()
+
+
+@pytest.fixture(scope="module")
+def large_memento_dict():
+    """Serialized memento of the large history, built once per module."""
+    return CalculatorMemento(history=list(_LARGE_HISTORY)).to_dict()
+
 
 class TestCalculatorMemento:
     """Test suite for CalculatorMemento class."""
@@ -16,8 +43,8 @@ class TestCalculatorMemento:
 
     def test_memento_creation_with_history(self):
         """Test creating a memento with calculation history."""
-        calc1 = Calculation(operation="Addition", operand1=Decimal("2"), operand2=Decimal("3"))
-        calc2 = Calculation(operation="Subtraction", operand1=Decimal("5"), operand2=Decimal("2"))
+        calc1 = Calculation(operation="Addition", operand1=Decimal(2), operand2=Decimal(3))
+        calc2 = Calculation(operation="Subtraction", operand1=Decimal(5), operand2=Decimal(2))
         
         memento = CalculatorMemento(history=[calc1, calc2])
         
@@ -50,13 +77,9 @@ class TestCalculatorMemento:
         assert 'timestamp' in result
         assert isinstance(result['timestamp'], str)
 
-    def test_to_dict_with_history(self):
+    def test_to_dict_with_history(self, sample_dict):
         """Test converting memento with history to dictionary."""
-        calc1 = Calculation(operation="Addition", operand1=Decimal("2"), operand2=Decimal("3"))
-        calc2 = Calculation(operation="Multiplication", operand1=Decimal("4"), operand2=Decimal("5"))
-        
-        memento = CalculatorMemento(history=[calc1, calc2])
-        result = memento.to_dict()
+        result = sample_dict
         
         assert len(result['history']) == 2
         assert result['history'][0]['operation'] == "Addition"
@@ -65,19 +88,15 @@ class TestCalculatorMemento:
         assert result['history'][1]['result'] == "20"
         assert isinstance(result['timestamp'], str)
 
-    def test_to_dict_timestamp_format(self):
+    def test_to_dict_timestamp_format(self, sample_dict):
         """Test that timestamp is properly formatted in ISO format."""
-        custom_time = datetime(2024, 1, 15, 10, 30, 45, 123456)
-        memento = CalculatorMemento(history=[], timestamp=custom_time)
-        result = memento.to_dict()
-        
-        assert result['timestamp'] == custom_time.isoformat()
+        assert sample_dict['timestamp'] == '2024-01-15T10:30:45.123456'
 
     def test_from_dict_empty_history(self):
         """Test creating memento from dictionary with empty history."""
         data = {
             'history': [],
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _ISO_NOW
         }
         
         memento = CalculatorMemento.from_dict(data)
@@ -94,14 +113,14 @@ class TestCalculatorMemento:
                     'operand1': '2',
                     'operand2': '3',
                     'result': '5',
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': _ISO_NOW
                 },
                 {
                     'operation': 'Division',
                     'operand1': '10',
                     'operand2': '2',
                     'result': '5',
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': _ISO_NOW
                 }
             ],
             'timestamp': datetime(2024, 1, 15, 10, 30, 0).isoformat()
@@ -111,9 +130,9 @@ class TestCalculatorMemento:
         
         assert len(memento.history) == 2
         assert memento.history[0].operation == 'Addition'
-        assert memento.history[0].result == Decimal('5')
+        assert memento.history[0].result == Decimal(5)
         assert memento.history[1].operation == 'Division'
-        assert memento.history[1].result == Decimal('5')
+        assert memento.history[1].result == Decimal(5)
         assert memento.timestamp == datetime(2024, 1, 15, 10, 30, 0)
 
     def test_from_dict_preserves_timestamp(self):
@@ -143,9 +162,9 @@ class TestCalculatorMemento:
 
     def test_round_trip_serialization_with_history(self):
         """Test that serialization and deserialization preserves memento with history."""
-        calc1 = Calculation(operation="Addition", operand1=Decimal("10"), operand2=Decimal("20"))
-        calc2 = Calculation(operation="Power", operand1=Decimal("2"), operand2=Decimal("3"))
-        calc3 = Calculation(operation="Root", operand1=Decimal("16"), operand2=Decimal("2"))
+        calc1 = Calculation(operation="Addition", operand1=Decimal(10), operand2=Decimal(20))
+        calc2 = Calculation(operation="Power", operand1=Decimal(2), operand2=Decimal(3))
+        calc3 = Calculation(operation="Root", operand1=Decimal(16), operand2=Decimal(2))
         
         original = CalculatorMemento(
             history=[calc1, calc2, calc3],
@@ -160,53 +179,50 @@ class TestCalculatorMemento:
         
         assert len(restored.history) == 3
         assert restored.history[0].operation == "Addition"
-        assert restored.history[0].result == Decimal("30")
+        assert restored.history[0].result == Decimal(30)
         assert restored.history[1].operation == "Power"
-        assert restored.history[1].result == Decimal("8")
+        assert restored.history[1].result == Decimal(8)
         assert restored.history[2].operation == "Root"
-        assert restored.history[2].result == Decimal("4")
+        assert restored.history[2].result == Decimal(4)
         assert restored.timestamp == original.timestamp
 
     def test_memento_with_multiple_operations(self):
         """Test memento with various calculation operations."""
         calculations = [
-            Calculation(operation="Addition", operand1=Decimal("1"), operand2=Decimal("2")),
-            Calculation(operation="Subtraction", operand1=Decimal("10"), operand2=Decimal("3")),
-            Calculation(operation="Multiplication", operand1=Decimal("4"), operand2=Decimal("5")),
-            Calculation(operation="Division", operand1=Decimal("20"), operand2=Decimal("4")),
-            Calculation(operation="Power", operand1=Decimal("3"), operand2=Decimal("2")),
-            Calculation(operation="Root", operand1=Decimal("25"), operand2=Decimal("2"))
+            Calculation(operation="Addition", operand1=Decimal(1), operand2=Decimal(2)),
+            Calculation(operation="Subtraction", operand1=Decimal(10), operand2=Decimal(3)),
+            Calculation(operation="Multiplication", operand1=Decimal(4), operand2=Decimal(5)),
+            Calculation(operation="Division", operand1=Decimal(20), operand2=Decimal(4)),
+            Calculation(operation="Power", operand1=Decimal(3), operand2=Decimal(2)),
+            Calculation(operation="Root", operand1=Decimal(25), operand2=Decimal(2))
         ]
         
         memento = CalculatorMemento(history=calculations)
         
         assert len(memento.history) == 6
-        assert memento.history[0].result == Decimal("3")
-        assert memento.history[1].result == Decimal("7")
-        assert memento.history[2].result == Decimal("20")
-        assert memento.history[3].result == Decimal("5")
-        assert memento.history[4].result == Decimal("9")
-        assert memento.history[5].result == Decimal("5")
-
-    def test_to_dict_structure(self):
+        assert memento.history[0].result == Decimal(3)
+        assert memento.history[1].result == Decimal(7)
+        assert memento.history[2].result == Decimal(20)
+        assert memento.history[3].result == Decimal(5)
+        assert memento.history[4].result == Decimal(9)
+        assert memento.history[5].result == Decimal(5)
+
+    def test_to_dict_structure(self, sample_dict):
         """Test that to_dict returns correct structure."""
-        calc = Calculation(operation="Addition", operand1=Decimal("5"), operand2=Decimal("5"))
-        memento = CalculatorMemento(history=[calc])
-        result = memento.to_dict()
+        result = sample_dict
         
         assert isinstance(result, dict)
         assert 'history' in result
         assert 'timestamp' in result
         assert isinstance(result['history'], list)
-        assert len(result['history']) == 1
-        assert isinstance(result['history'][0], dict)
+        assert all(isinstance(entry, dict) for entry in result['history'])
 
     def test_from_dict_with_different_timestamp_formats(self):
         """Test from_dict handles ISO format timestamp correctly."""
         # Test with microseconds
         data1 = {
             'history': [],
-            'timestamp': '2024-01-15T10:30:45.123456'
+            'timestamp': _ISO_NOW
         }
         memento1 = CalculatorMemento.from_dict(data1)
         assert memento1.timestamp.microsecond == 123456
@@ -221,29 +237,27 @@ class TestCalculatorMemento:
 
     def test_memento_history_is_list_of_calculations(self):
         """Test that memento history contains Calculation instances."""
-        calc1 = Calculation(operation="Addition", operand1=Decimal("1"), operand2=Decimal("1"))
-        calc2 = Calculation(operation="Subtraction", operand1=Decimal("5"), operand2=Decimal("3"))
+        calc1 = Calculation(operation="Addition", operand1=Decimal(1), operand2=Decimal(1))
+        calc2 = Calculation(operation="Subtraction", operand1=Decimal(5), operand2=Decimal(3))
         
         memento = CalculatorMemento(history=[calc1, calc2])
         
         for calc in memento.history:
             assert isinstance(calc, Calculation)
 
-    def test_large_history(self):
-        """Test memento with a large number of calculations."""
-        calculations = [
-            Calculation(operation="Addition", operand1=Decimal(str(i)), operand2=Decimal("1"))
-            for i in range(100)
-        ]
+    def test_round_trip_serialization_preserves_calculations(self):
+        """Test that a round trip reproduces every calculation in the history."""
+        original = CalculatorMemento(history=list(_LARGE_HISTORY[:10]))
         
-        memento = CalculatorMemento(history=calculations)
-        
-        assert len(memento.history) == 100
+        restored = CalculatorMemento.from_dict(original.to_dict())
         
+        assert restored.history == original.history
+
+    def test_large_history(self, large_memento_dict):
+        """Test memento with a large number of calculations."""
         # Test serialization with large history
-        data = memento.to_dict()
-        assert len(data['history']) == 100
+        assert len(large_memento_dict['history']) == 100
         
         # Test deserialization
-        restored = CalculatorMemento.from_dict(data)
-        assert len(restored.history) == 100
\ No newline at end of file
+        restored = CalculatorMemento.from_dict(large_memento_dict)
+        assert len(restored.history) == 100